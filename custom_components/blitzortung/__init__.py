@@ -5,15 +5,15 @@ import math
 import time
 
 import voluptuous as vol
+from awesomeversion import AwesomeVersion
 
-from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE, CONF_NAME, UnitOfLength
 from homeassistant.core import callback, HomeAssistant
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import async_track_time_interval
 
-from homeassistant.util.json import json_loads_object
+from homeassistant.util.json import json_loads, json_loads_object
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM
 from homeassistant.util.unit_conversion import DistanceConverter
 
@@ -40,6 +40,12 @@ from .version import __version__
 
 _LOGGER = logging.getLogger(__name__)
 
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+_EARTH_RADIUS_KM = 6371.0
+
+_CURRENT_VERSION = AwesomeVersion(__version__)
+
 CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: vol.Schema({vol.Optional(SERVER_STATS, default=False): bool})},
     extra=vol.ALLOW_EXTRA,
@@ -183,16 +189,30 @@ class BlitzortungCoordinator:
         self.radius = radius
         self.max_tracked_lightnings = max_tracked_lightnings
         self.time_window_seconds = time_window_seconds
+        self._time_window_ns = time_window_seconds * 1_000_000_000
         self.server_stats = server_stats
-        self.last_time = 0
-        self.sensors = []
-        self.callbacks = []
-        self.lightning_callbacks = []
-        self.on_tick_callbacks = []
+        self.last_time_ns = None
+        self._is_inactive = bool(time_window_seconds)
+        self.sensors = ()
+        self.callbacks = ()
+        self.lightning_callbacks = ()
+        self.on_tick_callbacks = ()
+        self._pending_lightnings = []
+        self._cos_lat = math.cos(self.latitude * _DEG2RAD)
+        self._lon_scale = _DEG2RAD * self._cos_lat
+        self._radius_sq_rad = (self.radius / _EARTH_RADIUS_KM) ** 2
+        # same bounding box as used for geohash tiles, slightly larger than radius
+        self._lat_delta = self.radius * 360 / 40000
+        self._lon_delta = self._lat_delta / self._cos_lat
         self.geohash_overlap = geohash_overlap(
             self.latitude, self.longitude, self.radius
         )
+        self._geohash_topics = tuple(
+            "blitzortung/1.1/{}/#".format("/".join(geohash_code))
+            for geohash_code in self.geohash_overlap
+        )
         self._disconnect_callbacks = []
+        self._sensor_write_scheduled = False
         self.unloading = False
 
         _LOGGER.info(
@@ -222,32 +242,46 @@ class BlitzortungCoordinator:
 
     @callback
     def _on_connection_change(self, *args, **kwargs):
+        if self.unloading or self._sensor_write_scheduled:
+            return
+        # connect/disconnect signals often come in quick succession,
+        # write sensor states once for all of them
+        self._sensor_write_scheduled = True
+        self.hass.loop.call_soon(self._write_sensor_states)
+
+    @callback
+    def _write_sensor_states(self):
+        self._sensor_write_scheduled = False
         if self.unloading:
             return
         for sensor in self.sensors:
             sensor.async_write_ha_state()
 
     def compute_polar_coords(self, lightning):
-        dy = (lightning["lat"] - self.latitude) * math.pi / 180
-        dx = (
-            (lightning["lon"] - self.longitude)
-            * math.pi
-            / 180
-            * math.cos(self.latitude * math.pi / 180)
-        )
-        distance = round(math.sqrt(dx * dx + dy * dy) * 6371, 1)
-        azimuth = round(math.atan2(dx, dy) * 180 / math.pi) % 360
+        # Equirectangular approximation: strikes are only kept within `radius`
+        # (at most a few hundred km), where the error against haversine stays
+        # well below the 0.1 km rounding, at a fraction of the trig cost.
+        # Returns False without touching `lightning` if it is outside `radius`.
+        dy = (lightning["lat"] - self.latitude) * _DEG2RAD
+        dx = (lightning["lon"] - self.longitude) * self._lon_scale
+        distance_sq = dx * dx + dy * dy
+        if distance_sq >= self._radius_sq_rad:
+            return False
+        distance = round(math.sqrt(distance_sq) * _EARTH_RADIUS_KM, 1)
+        azimuth = round(math.atan2(dx, dy) * _RAD2DEG)
+        if azimuth < 0:
+            azimuth += 360
 
         lightning[ATTR_LIGHTNING_DISTANCE] = distance
         lightning[ATTR_LIGHTNING_AZIMUTH] = azimuth
+        return True
 
     async def connect(self):
         await self.mqtt_client.async_connect()
         _LOGGER.info("Connected to Blitzortung proxy mqtt server")
-        for geohash_code in self.geohash_overlap:
-            geohash_part = "/".join(geohash_code)
+        for topic in self._geohash_topics:
             await self.mqtt_client.async_subscribe(
-                "blitzortung/1.1/{}/#".format(geohash_part), self.on_mqtt_message, qos=0
+                topic, self.on_lightning_message, qos=0
             )
         if self.server_stats:
             await self.mqtt_client.async_subscribe(
@@ -264,13 +298,12 @@ class BlitzortungCoordinator:
     async def disconnect(self):
         self.unloading = True
         await self.mqtt_client.async_disconnect()
-        for cb in self._disconnect_callbacks:
+        callbacks, self._disconnect_callbacks = self._disconnect_callbacks, []
+        for cb in callbacks:
             cb()
 
+    @callback
     def on_hello_message(self, message, *args):
-        def parse_version(version_str):
-            return tuple(map(int, version_str.split(".")))
-
         data = json_loads_object(message.payload)
         latest_version_str = data.get("latest_version")
         if latest_version_str:
@@ -280,9 +313,7 @@ class BlitzortungCoordinator:
             )
             latest_version_message = data.get("latest_version_message", default_message)
             latest_version_title = data.get("latest_version_title", "Blitzortung")
-            latest_version = parse_version(latest_version_str)
-            current_version = parse_version(__version__)
-            if latest_version > current_version:
+            if AwesomeVersion(latest_version_str) > _CURRENT_VERSION:
                 _LOGGER.info("new version is available: %s", latest_version_str)
                 self.hass.components.persistent_notification.async_create(
                     title=latest_version_title,
@@ -290,44 +321,81 @@ class BlitzortungCoordinator:
                     notification_id="blitzortung_new_version_available",
                 )
 
-    async def on_mqtt_message(self, message, *args):
-        for callback in self.callbacks:
-            callback(message)
-        if message.topic.startswith("blitzortung/1.1"):
-            lightning = json_loads_object(message.payload)
-            self.compute_polar_coords(lightning)
-            if lightning[SensorDeviceClass.DISTANCE] < self.radius:
-                _LOGGER.debug("lightning data: %s", lightning)
-                self.last_time = time.time()
-                for callback in self.lightning_callbacks:
-                    await callback(lightning)
-                for sensor in self.sensors:
-                    sensor.update_lightning(lightning)
+    @callback
+    def on_mqtt_message(self, message, *args):
+        for message_cb in self.callbacks:
+            message_cb(message)
+
+    @callback
+    def on_lightning_message(self, message, *args):
+        try:
+            lightning = json_loads(message.payload)
+            outside_bbox = (
+                abs(lightning["lat"] - self.latitude) > self._lat_delta
+                or abs(lightning["lon"] - self.longitude) > self._lon_delta
+            )
+        except (ValueError, KeyError, TypeError) as err:
+            _LOGGER.warning(
+                "Invalid lightning data on %s: %s (%s)",
+                message.topic,
+                message.payload,
+                err,
+            )
+            return
+        if outside_bbox:
+            return
+        if not self.compute_polar_coords(lightning):
+            return
+        _LOGGER.debug("lightning data: %s", lightning)
+        self.last_time_ns = time.monotonic_ns()
+        self._is_inactive = False
+        if not self._pending_lightnings:
+            self.hass.loop.call_soon(self._flush_lightnings)
+        self._pending_lightnings.append(lightning)
+
+    @callback
+    def _flush_lightnings(self):
+        # strikes received in the same event loop iteration are passed
+        # to receivers and sensors together, so each of them runs once
+        lightnings, self._pending_lightnings = self._pending_lightnings, []
+        if self.unloading:
+            return
+        for lightning_cb in self.lightning_callbacks:
+            try:
+                lightning_cb(lightnings)
+            except Exception:
+                _LOGGER.exception("Error in lightning receiver %s", lightning_cb)
+        for sensor in self.sensors:
+            sensor.update_lightnings(lightnings)
 
     def register_sensor(self, sensor):
-        self.sensors.append(sensor)
+        self.sensors = (*self.sensors, sensor)
         self.register_on_tick(sensor.tick)
 
     def register_message_receiver(self, message_cb):
-        self.callbacks.append(message_cb)
+        self.callbacks = (*self.callbacks, message_cb)
 
     def register_lightning_receiver(self, lightning_cb):
-        self.lightning_callbacks.append(lightning_cb)
+        self.lightning_callbacks = (*self.lightning_callbacks, lightning_cb)
 
     def register_on_tick(self, on_tick_cb):
-        self.on_tick_callbacks.append(on_tick_cb)
+        self.on_tick_callbacks = (*self.on_tick_callbacks, on_tick_cb)
 
     @property
     def is_inactive(self):
-        return bool(
-            self.time_window_seconds
-            and (time.time() - self.last_time) >= self.time_window_seconds
-        )
+        return self._is_inactive
 
     @property
     def is_connected(self):
         return self.mqtt_client.connected
 
     async def _tick(self, *args):
+        self._is_inactive = bool(
+            self.time_window_seconds
+            and (
+                self.last_time_ns is None
+                or (time.monotonic_ns() - self.last_time_ns) >= self._time_window_ns
+            )
+        )
         for cb in self.on_tick_callbacks:
             cb()
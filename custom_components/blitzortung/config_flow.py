@@ -12,6 +12,7 @@ from homeassistant.config_entries import (
 from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE, CONF_NAME
 
 from .const import (
+    CONFIG_ENTRY_VERSION,
     CONF_MAX_TRACKED_LIGHTNINGS,
     CONF_RADIUS,
     CONF_TIME_WINDOW,
@@ -21,6 +22,14 @@ from .const import (
     DOMAIN,
 )
 
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): str,
+        vol.Required(CONF_LATITUDE): cv.latitude,
+        vol.Required(CONF_LONGITUDE): cv.longitude,
+    }
+)
+
 RECONFIGURE_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_LATITUDE): cv.latitude,
@@ -28,11 +37,21 @@ RECONFIGURE_SCHEMA = vol.Schema(
     }
 )
 
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_RADIUS, default=DEFAULT_RADIUS): int,
+        vol.Optional(CONF_TIME_WINDOW, default=DEFAULT_TIME_WINDOW): int,
+        vol.Optional(
+            CONF_MAX_TRACKED_LIGHTNINGS, default=DEFAULT_MAX_TRACKED_LIGHTNINGS
+        ): int,
+    }
+)
+
 
 class BlitortungConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for blitzortung."""
 
-    VERSION = 5
+    VERSION = CONFIG_ENTRY_VERSION
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -55,20 +74,13 @@ class BlitortungConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_NAME, default=self.hass.config.location_name
-                    ): str,
-                    vol.Required(
-                        CONF_LATITUDE,
-                        default=self.hass.config.latitude,
-                    ): cv.latitude,
-                    vol.Required(
-                        CONF_LONGITUDE,
-                        default=self.hass.config.longitude,
-                    ): cv.longitude,
-                }
+            data_schema=self.add_suggested_values_to_schema(
+                data_schema=USER_SCHEMA,
+                suggested_values={
+                    CONF_NAME: self.hass.config.location_name,
+                    CONF_LATITUDE: self.hass.config.latitude,
+                    CONF_LONGITUDE: self.hass.config.longitude,
+                },
             ),
         )
 
@@ -118,32 +130,9 @@ class BlitzortungOptionsFlowHandler(OptionsFlowWithConfigEntry):
         if user_input is not None:
             return self.async_create_entry(data=user_input)
 
-        options_schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_RADIUS,
-                    default=self.config_entry.options.get(CONF_RADIUS, DEFAULT_RADIUS),
-                ): int,
-                vol.Optional(
-                    CONF_TIME_WINDOW,
-                    default=self.config_entry.options.get(
-                        CONF_TIME_WINDOW,
-                        DEFAULT_TIME_WINDOW,
-                    ),
-                ): int,
-                vol.Optional(
-                    CONF_MAX_TRACKED_LIGHTNINGS,
-                    default=self.config_entry.options.get(
-                        CONF_MAX_TRACKED_LIGHTNINGS,
-                        DEFAULT_MAX_TRACKED_LIGHTNINGS,
-                    ),
-                ): int,
-            }
-        )
-
         return self.async_show_form(
             step_id="init",
             data_schema=self.add_suggested_values_to_schema(
-                options_schema, self.config_entry.options
+                OPTIONS_SCHEMA, self.config_entry.options
             ),
         )
@@ -17,6 +17,7 @@ SW_VERSION = __version__
 PLATFORMS = ["sensor", "geo_location"]
 
 DOMAIN = "blitzortung"
+CONFIG_ENTRY_VERSION = 5
 BLITZORTUNG_CONFIG: HassKey[BlitzortungConfig] = HassKey(DOMAIN)
 ATTR_LIGHTNING_AZIMUTH = "azimuth"
 ATTR_LIGHTNING_COUNTER = "counter"
@@ -1,5 +1,6 @@
 """Diagnostics support for Blitzortung."""
 
+import time
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -11,7 +12,15 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, config_entry: BlitzortungConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
+    coordinator = dict(vars(config_entry.runtime_data))
+    # monotonic clock value is meaningless outside this process
+    last_time_ns = coordinator.pop("last_time_ns")
+    coordinator["seconds_since_last_strike"] = (
+        None
+        if last_time_ns is None
+        else round((time.monotonic_ns() - last_time_ns) / 1e9, 1)
+    )
     return {
         "config_entry": config_entry.as_dict(),
-        "coordinator": vars(config_entry.runtime_data),
+        "coordinator": coordinator,
     }
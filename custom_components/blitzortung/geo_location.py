@@ -47,7 +47,7 @@ async def async_setup_entry(
         coordinator.time_window_seconds,
     )
 
-    coordinator.register_lightning_receiver(manager.lightning_cb)
+    coordinator.register_lightning_receiver(manager.lightnings_cb)
     coordinator.register_on_tick(manager.tick)
 
 
@@ -112,19 +112,35 @@ class BlitzortungEventManager:
         else:
             self._unit = UnitOfLength.KILOMETERS
 
-    async def lightning_cb(self, lightning):
-        _LOGGER.debug("geo_location lightning: %s", lightning)
-        event = BlitzortungEvent(
-            lightning["distance"],
-            lightning["lat"],
-            lightning["lon"],
-            self._unit,
-            lightning["time"],
-            lightning["status"],
-            lightning["region"],
-        )
-        to_delete = self._strikes.insort(event)
-        self._async_add_entities([event])
+    @callback
+    def lightnings_cb(self, lightnings):
+        events = []
+        to_delete = []
+        for lightning in lightnings:
+            _LOGGER.debug("geo_location lightning: %s", lightning)
+            try:
+                event = BlitzortungEvent(
+                    lightning["distance"],
+                    lightning["lat"],
+                    lightning["lon"],
+                    self._unit,
+                    lightning["time"],
+                    lightning.get("status"),
+                    lightning.get("region"),
+                )
+            except (KeyError, TypeError) as err:
+                _LOGGER.warning("Invalid lightning data: %s (%s)", lightning, err)
+                continue
+            events.append(event)
+            to_delete.extend(self._strikes.insort(event))
+        if to_delete:
+            # strikes evicted within this batch were never added as entities
+            new_ids = {e._strike_id for e in events}
+            evicted_ids = {e._strike_id for e in to_delete}
+            events = [e for e in events if e._strike_id not in evicted_ids]
+            to_delete = [e for e in to_delete if e._strike_id not in new_ids]
+        if events:
+            self._async_add_entities(events)
         if to_delete:
             self._remove_events(to_delete)
         _LOGGER.debug("tracked lightnings: %s", len(self._strikes))
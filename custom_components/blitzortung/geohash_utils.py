@@ -1,5 +1,6 @@
 import math
 from collections import namedtuple
+from functools import lru_cache
 
 from . import geohash
 
@@ -46,6 +47,7 @@ def compute_geohash_tiles(lat, lon, radius, precision):
     return checked
 
 
+@lru_cache(maxsize=64)
 def geohash_overlap(lat, lon, radius, max_tiles=9):
     result = []
     for precision in range(1, 13):
@@ -55,4 +57,4 @@ def geohash_overlap(lat, lon, radius, max_tiles=9):
             precision += 1
         else:
             break
-    return result
+    return tuple(sorted(result))
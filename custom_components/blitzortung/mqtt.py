@@ -10,7 +10,7 @@ import attr
 import paho.mqtt.client as mqtt
 from paho.mqtt.matcher import MQTTMatcher
 
-from homeassistant.core import callback, HomeAssistant
+from homeassistant.core import callback, HassJob, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.util import dt as dt_util
@@ -71,6 +71,7 @@ class Subscription:
 
     topic = attr.ib(type=str)
     callback = attr.ib(type=MessageCallbackType)
+    job = attr.ib(type=HassJob)
     qos = attr.ib(type=int, default=0)
     encoding = attr.ib(type=str, default="utf-8")
 
@@ -156,7 +157,9 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(topic, msg_callback, qos, encoding)
+        subscription = Subscription(
+            topic, msg_callback, HassJob(msg_callback), qos, encoding
+        )
         self.subscriptions.append(subscription)
 
         # Only subscribe if currently connected.
@@ -262,17 +265,16 @@ class MQTT:
                     )
                     continue
 
-            self.hass.async_create_task(
-                subscription.callback(
-                    Message(
-                        msg.topic,
-                        payload,
-                        msg.qos,
-                        msg.retain,
-                        subscription.topic,
-                        timestamp,
-                    )
-                )
+            self.hass.async_run_hass_job(
+                subscription.job,
+                Message(
+                    msg.topic,
+                    payload,
+                    msg.qos,
+                    msg.retain,
+                    subscription.topic,
+                    timestamp,
+                ),
             )
 
     def _mqtt_on_disconnect(self, _mqttc, _userdata, result_code: int) -> None:
@@ -82,7 +82,7 @@ class BlitzortungSensor(SensorEntity):
     async def async_update(self):
         await self.coordinator.async_request_refresh()
 
-    def update_lightning(self, lightning):
+    def update_lightnings(self, lightnings):
         pass
 
     def on_message(self, message):
@@ -114,8 +114,9 @@ class LightningSensor(BlitzortungSensor):
 class DistanceSensor(LightningSensor):
     """Define a Blitzortung distance sensor."""
 
-    def update_lightning(self, lightning):
+    def update_lightnings(self, lightnings):
         """Update the sensor data."""
+        lightning = lightnings[-1]
         self._attr_native_value = lightning[ATTR_LIGHTNING_DISTANCE]
         self._attr_extra_state_attributes = {
             ATTR_LAT: lightning[ATTR_LAT],
@@ -127,8 +128,9 @@ class DistanceSensor(LightningSensor):
 class AzimuthSensor(LightningSensor):
     """Define a Blitzortung azimuth sensor."""
 
-    def update_lightning(self, lightning):
+    def update_lightnings(self, lightnings):
         """Update the sensor data."""
+        lightning = lightnings[-1]
         self._attr_native_value = lightning[ATTR_LIGHTNING_AZIMUTH]
         self._attr_extra_state_attributes = {
             ATTR_LAT: lightning[ATTR_LAT],
@@ -142,8 +144,8 @@ class CounterSensor(LightningSensor):
 
     INITIAL_STATE = 0
 
-    def update_lightning(self, lightning):
-        self._attr_native_value = self._attr_native_value + 1
+    def update_lightnings(self, lightnings):
+        self._attr_native_value = self._attr_native_value + len(lightnings)
         self.async_write_ha_state()
 
 
@@ -167,15 +169,16 @@ class ServerStatSensor(BlitzortungSensor):
         if self.data_type in (int, float):
             self._attr_state_class = SensorStateClass.MEASUREMENT
 
-        super().__init__(coordinator, description, integration_name, unique_prefix)
-
-    @property
-    def native_unit_of_measurement(self):
         if self.kind == "uptime":
-            return UnitOfTime.SECONDS
-        if self.data_type in (int, float):
-            return "clients" if self.kind == "clients_connected" else " "
-        return None
+            self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
+        elif self.data_type in (int, float):
+            self._attr_native_unit_of_measurement = (
+                "clients" if self.kind == "clients_connected" else " "
+            )
+        else:
+            self._attr_native_unit_of_measurement = None
+
+        super().__init__(coordinator, description, integration_name, unique_prefix)
 
     def on_message(self, topic, message):
         if topic == self._topic: